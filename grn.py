@@ -1,7 +1,6 @@
 
 import numpy as np
 import simulator
-from helpers import powerset
 
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -53,7 +52,12 @@ class grn:
         self.genes.append(gene)
 
 
-    def generate_equations(self):
+    def generate_equations(self, shared_terms=None):
+        """
+        shared_terms: optional dict; when given, every distinct regulator term
+        ((X/Kd)**n) is registered as shared_terms[expr] = name and the equations
+        refer to it by name, so generate_model can evaluate it once per call.
+        """
         equations = {}
         
         for species in self.species:
@@ -73,6 +77,8 @@ class grn:
                 
         
                 regulator_term = f'(({name}/{Kd})**{n})'
+                if shared_terms is not None:
+                    regulator_term = shared_terms.setdefault(regulator_term, f'_h{len(shared_terms)}')
                 
                 if regulator['type'] == 1:
                     up.append(regulator_term)
@@ -82,8 +88,10 @@ class grn:
             if not up:
                 up = ['1']
 
+            # The sum of the products over all non-empty subsets of terms t_i equals prod(1+t_i) - 1,
+            # which is linear in the number of regulators instead of exponential
             if logic_type == 'or':
-                up = "+".join(powerset(up, op="*"))
+                up = up[0] if len(up) == 1 else '*'.join([f'(1+{t})' for t in up]) + '-1'
             elif logic_type == 'and':
                 up = '*'.join(up)
             elif logic_type == '':
@@ -92,7 +100,7 @@ class grn:
                 print("Invalid logic type!")
                 return
 
-            down = "+".join(['1'] + powerset(down, op="*"))
+            down = '*'.join([f'(1+{t})' for t in down]) if down else '1'
 
             terms = f'{gene["alpha"]}*({up})/({down})'
 
@@ -102,7 +110,8 @@ class grn:
         return equations
 
     def generate_model(self, fname='model.py'):
-        equations = self.generate_equations()
+        shared_terms = {}
+        equations = self.generate_equations(shared_terms)
 
         with open(fname, 'w') as f: 
             print(f'import numpy as np \n', file = f)
@@ -113,6 +122,10 @@ class grn:
             
             print(f'    {all_keys} = state', file=f)
 
+            # regulator terms shared between genes are computed once
+            for term, term_name in shared_terms.items():
+                print(f'    {term_name} = {term}', file=f)
+
             for key in equations.keys():
                 print(f'    d{key} = {"+".join(equations[key])}', file=f)
                 
@@ -1,28 +1,77 @@
 import sys
+import traceback
 import math
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager, nullcontext
 
-# For plotting:
-import matplotlib
-matplotlib.use("Qt5Agg")
-import matplotlib.pyplot as plt
-import networkx as nx
+import numpy as np
 
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QToolBar, QAction,
-    QGraphicsScene, QGraphicsView, QGraphicsEllipseItem, QGraphicsLineItem, QDialog,
-    QMessageBox, QInputDialog, QGraphicsItem, QVBoxLayout, QLineEdit, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QFileDialog
+    QGraphicsScene, QGraphicsView, QGraphicsEllipseItem, QGraphicsPathItem, QDialog,
+    QMessageBox, QGraphicsItem, QVBoxLayout, QLineEdit, QPushButton, QLabel, QTableView, QFileDialog,
+    QProgressDialog, QFormLayout, QDoubleSpinBox, QComboBox, QDialogButtonBox
 )
 from PyQt5.QtGui import (
-    QPainter, QPen, QBrush, QColor, QFont, QPolygonF
+    QPainter, QPainterPath, QPen, QBrush, QColor, QFont, QTransform
 )
 from PyQt5.QtCore import (
-    Qt, QRectF, QPointF
+    Qt, QRectF, QPointF, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractTableModel, QModelIndex
 )
 
+# For plotting: matplotlib and networkx are imported on first use to keep startup fast
+_MPL_INITIALIZED = False
+
+def _use_qt_backend():
+    """
+    Select the Qt5Agg matplotlib backend once, before anything imports pyplot.
+    """
+    global _MPL_INITIALIZED
+    if not _MPL_INITIALIZED:
+        import matplotlib
+        matplotlib.use("Qt5Agg")
+        _MPL_INITIALIZED = True
+
+# Shared pens / brushes, so items and mouse-move handlers never allocate their own
+BRUSH_INPUT = QBrush(QColor("#006600"))   # green
+BRUSH_OUTPUT = QBrush(QColor("#660066"))  # purple
+BRUSH_NORMAL = QBrush(QColor("#444444"))  # dark gray
+PEN_BLACK = QPen(Qt.black, 1)             # node outline
+PEN_PINNED = QPen(QColor("cyan"), 2)      # node pinned as edge target
+PEN_ACTIVATION = QPen(QColor("blue"), 3)  # activating edge
+PEN_REPRESSION = QPen(QColor("red"), 3)   # repressing edge
+
 # ---------------------------------------------------
 # 1) A minimal GRN class with networkx + matplotlib
 # ---------------------------------------------------
+class LayoutSignals(QObject):
+    finished = pyqtSignal(object)  # {node: (x, y)}, or None if the layout failed
+
+
+class LayoutWorker(QRunnable):
+    """
+    Runs a layout function `layout(G) -> {node: (x, y)}` on a QThreadPool
+    thread so the UI stays responsive. The positions are delivered through
+    signals.finished; None is delivered if the layout raised.
+    """
+
+    def __init__(self, layout, G):
+        super().__init__()
+        self.layout = layout
+        self.G = G
+        self.signals = LayoutSignals()
+
+    def run(self):
+        try:
+            pos = self.layout(self.G)
+        except Exception:
+            traceback.print_exc()
+            pos = None
+        self.signals.finished.emit(pos)
+
+
 class MyGRN:
     """
     Mock Gene Regulatory Network that we can plot with networkx.
@@ -33,8 +82,15 @@ class MyGRN:
     - Edge data: we just store them in Nx as (u->v).
     """
 
+    EDGE_COLORS = {1: "blue", -1: "red"}  # by regType, anything else is orange
+    EXACT_LAYOUT_MAX_NODES = 64  # larger graphs use the Barnes-Hut layout
+    LAYOUT_CACHE_SIZE = 8  # most recently used topologies whose layouts are kept
+
     def __init__(self):
+        import networkx as nx
         self.G = nx.DiGraph()
+        self._layout_cache = OrderedDict()  # graph signature -> positions, least recently used first
+        self._layout_signals = set()  # signal sources of layouts still running
 
     def add_input_species(self, name: str):
         self.G.add_node(name, node_type="input")
@@ -42,6 +98,9 @@ class MyGRN:
     def add_species(self, name: str, degrade_rate: float):
         self.G.add_node(name, node_type="output", degrade=degrade_rate)
 
+    def add_gene(self, name: str):
+        self.G.add_node(name, node_type="normal")
+
     def add_edge(self, source_name: str, target_name: str, reg_type=0, kd=1.0, n=1.0):
         """
         reg_type: 1 => activating (blue), -1 => repressing (red), 0 => unknown (orange)
@@ -49,32 +108,338 @@ class MyGRN:
         """
         self.G.add_edge(source_name, target_name, regType=reg_type, kd=kd, n=n)
 
-    def plot_network(self):
+    @staticmethod
+    def _fr_energy(flat, A, k):
+        """
+        FR energy of the flattened (N, 2) positions and its gradient, for the
+        symmetric 0/1 adjacency matrix A.
+        """
+        n = len(A)
+        x = flat.reshape(n, 2)
+        upper = np.triu_indices(n, 1)
+        delta = x[:, None, :] - x[None, :, :]
+        d = np.maximum(np.sqrt((delta ** 2).sum(-1)), 1e-9)
+        np.fill_diagonal(d, 1.0)
+        e = (A[upper] * d[upper] ** 3).sum() / (3 * k) - k * k * np.log(d[upper]).sum()
+        coeff = A * d / k - k * k / (d * d)
+        np.fill_diagonal(coeff, 0)
+        grad = (coeff[:, :, None] * delta).sum(1)
+        return e, grad.ravel()
+
+    @staticmethod
+    def _lbfgs_spring_layout(G, maxiter=50, seed=0):
+        """
+        Fruchterman-Reingold layout found by minimizing the FR energy with L-BFGS
+        instead of integrating forces with a fixed step:
+            E = sum_edges d^3 / (3k) - k^2 * sum_pairs ln(d),   k = 1/sqrt(N)
+        Edges attract regardless of direction. Positions are centered and scaled
+        to [-1, 1] like nx.spring_layout.
+        The repulsion between disconnected parts is unbounded, so each weakly
+        connected component is laid out on its own and the components are packed
+        in rows, largest first, with a radius growing as sqrt(component size).
+        """
+        import networkx as nx
+
+        components = sorted(nx.weakly_connected_components(G), key=len, reverse=True)
+        if len(components) == 1:
+            return MyGRN._lbfgs_component_layout(G, maxiter, seed)
+
+        gap = 0.3
+        largest = len(components[0])
+        radii = [np.sqrt(len(nodes) / largest) for nodes in components]
+        row_width = max(2 + gap, np.sqrt(sum((2 * r + gap) ** 2 for r in radii)))
+
+        pos = {}
+        x = y = row_height = 0.0
+        for nodes, radius in zip(components, radii):
+            side = 2 * radius + gap
+            if x > 0 and x + side > row_width:
+                x, y, row_height = 0.0, y - row_height, 0.0
+            center = np.array([x + side / 2, y - side / 2])
+            sub = MyGRN._lbfgs_component_layout(G.subgraph(nodes), maxiter, seed)
+            for v, p in sub.items():
+                pos[v] = center + radius * p
+            x += side
+            row_height = max(row_height, side)
+
+        coords = np.array(list(pos.values()))
+        middle = coords.mean(0)
+        scale = np.abs(coords - middle).max()
+        return {v: (p - middle) / scale for v, p in pos.items()}
+
+    @staticmethod
+    def _lbfgs_component_layout(G, maxiter, seed):
+        """
+        L-BFGS layout of a connected graph, centered and scaled to [-1, 1].
+        """
+        import networkx as nx
+        from scipy.optimize import minimize
+
+        nodes = list(G)
+        n = len(nodes)
+        if n == 1:
+            return {nodes[0]: np.zeros(2)}
+
+        A = nx.to_numpy_array(G, nodelist=nodes, weight=None)
+        A = np.maximum(A, A.T)
+        np.fill_diagonal(A, 0)
+        k = 1 / np.sqrt(n)
+
+        start = nx.random_layout(G, seed=seed)
+        x0 = np.array([start[v] for v in nodes], dtype=float)
+        result = minimize(MyGRN._fr_energy, x0.ravel(), args=(A, k), jac=True,
+                          method="L-BFGS-B", options={"maxiter": maxiter})
+
+        x = result.x.reshape(n, 2)
+        x -= x.mean(0)
+        scale = np.abs(x).max()
+        if scale > 0:
+            x /= scale
+        return dict(zip(nodes, x))
+
+    @staticmethod
+    def _barnes_hut_repulsion(pos, k2, theta):
+        """
+        Barnes-Hut estimate of the FR repulsion sum_j k^2 (x_i - x_j) / d_ij^2 on
+        every node of the (N, 2) positions `pos`. Nodes are binned into a quadtree of
+        depth ~log4(N); a cell whose width/distance is below `theta` repels as one body
+        at its center of mass, nearer cells are opened down to the leaves, which are
+        summed exactly. The tree is traversed for all nodes at once, one level per
+        numpy pass. theta=0 gives the exact sum.
+        """
+        n = len(pos)
+        depth = max(1, int(np.ceil(np.log(n) / np.log(4))))
+        lo = pos.min(0)
+        size = max((pos.max(0) - lo).max(), 1e-9)
+        leaf = np.minimum(((pos - lo) / size * (1 << depth)).astype(int), (1 << depth) - 1)
+        disp = np.zeros_like(pos)
+
+        def push(who, delta, weight):
+            d2 = np.maximum((delta * delta).sum(1), 1e-12)
+            force = delta * (k2 * weight / d2)[:, None]
+            disp[:, 0] += np.bincount(who, force[:, 0], minlength=n)
+            disp[:, 1] += np.bincount(who, force[:, 1], minlength=n)
+
+        # Frontier of (node, cell) pairs still to resolve, starting from the root cell
+        who = np.arange(n)
+        cell = np.zeros(n, dtype=int)
+        for level in range(depth + 1):
+            side = 1 << level
+            ij = leaf >> (depth - level)
+            node_cell = ij[:, 0] * side + ij[:, 1]
+            count = np.bincount(node_cell, minlength=side * side)
+            com = np.stack([np.bincount(node_cell, pos[:, 0], side * side),
+                            np.bincount(node_cell, pos[:, 1], side * side)], 1)
+            com /= np.maximum(count, 1)[:, None]
+
+            delta = pos[who] - com[cell]
+            width = size / side
+            far = (node_cell[who] != cell) & (width * width < theta * theta * (delta * delta).sum(1))
+            push(who[far], delta[far], count[cell[far]])
+            who, cell = who[~far], cell[~far]
+
+            if level < depth:
+                # Open the near cells into their non-empty children
+                ci, cj = np.divmod(cell, side)
+                who = np.repeat(who, 4)
+                cell = ((2 * np.repeat(ci, 4) + np.tile([0, 0, 1, 1], len(ci))) * 2 * side
+                        + 2 * np.repeat(cj, 4) + np.tile([0, 1, 0, 1], len(cj)))
+                child_count = np.bincount((leaf >> (depth - level - 1)) @ [2 * side, 1], minlength=4 * side * side)
+                keep = child_count[cell] > 0
+                who, cell = who[keep], cell[keep]
+            else:
+                # Exact repulsion from every other member of the near leaves
+                order = np.argsort(node_cell, kind="stable")
+                first = np.searchsorted(node_cell[order], cell)
+                members = count[cell]
+                offsets = np.arange(members.sum()) - np.repeat(np.cumsum(members) - members, members)
+                other = order[np.repeat(first, members) + offsets]
+                who = np.repeat(who, members)
+                mask = who != other
+                push(who[mask], pos[who[mask]] - pos[other[mask]], 1.0)
+        return disp
+
+    @staticmethod
+    def _barnes_hut_fr(G, iterations=50, theta=0.9, seed=0):
+        """
+        Fruchterman-Reingold iterations with Barnes-Hut repulsion (see
+        _barnes_hut_repulsion), O(N log N) per step. Positions are centered and
+        scaled to [-1, 1] like _lbfgs_spring_layout.
+        """
+        import networkx as nx
+
+        nodes = list(G)
+        n = len(nodes)
+        if n == 1:
+            return {nodes[0]: np.zeros(2)}
+
+        index = {v: i for i, v in enumerate(nodes)}
+        edges = np.array([(index[u], index[v]) for u, v in G.edges if u != v], dtype=int).reshape(-1, 2)
+        start = nx.random_layout(G, seed=seed)
+        pos = np.array([start[v] for v in nodes], dtype=float)
+
+        k2 = 1 / n  # k = 1/sqrt(N)
+        temperature = 0.1
+        cooling = temperature / (iterations + 1)
+
+        for _ in range(iterations):
+            disp = MyGRN._barnes_hut_repulsion(pos, k2, theta)
+
+            # Attraction along edges, regardless of direction
+            if len(edges):
+                delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+                force = delta * (np.sqrt((delta * delta).sum(1)) * np.sqrt(n))[:, None]  # d^2 / k
+                for c in range(2):
+                    disp[:, c] -= np.bincount(edges[:, 0], force[:, c], minlength=n)
+                    disp[:, c] += np.bincount(edges[:, 1], force[:, c], minlength=n)
+
+            length = np.maximum(np.sqrt((disp * disp).sum(1)), 0.01)
+            pos += disp * (temperature / length)[:, None]
+            temperature -= cooling
+
+        pos -= pos.mean(0)
+        scale = np.abs(pos).max()
+        if scale > 0:
+            pos /= scale
+        return dict(zip(nodes, pos))
+
+    def _graph_signature(self):
+        """
+        The node and edge sets; the layout only depends on topology.
+        """
+        return frozenset(self.G.nodes), frozenset(self.G.edges)
+
+    def plot_network(self, parent=None):
+        """
+        Show the network in a pyqtgraph viewer dialog, falling back to
+        matplotlib when pyqtgraph is not installed.
+        """
         if self.G.number_of_nodes() == 0:
             QMessageBox.warning(None, "Plot Error", "No nodes in the GRN!")
             return
 
-        pos = nx.spring_layout(self.G)
+        # Reuse the layout if the topology has not changed since the last plot
+        signature = self._graph_signature()
+        pos = self._layout_cache.get(signature)
+        if pos is not None:
+            self._layout_cache.move_to_end(signature)
+            self._draw_network(pos, parent)
+            return
+
+        # Compute the layout off the UI thread, render once it arrives
+        progress = QProgressDialog("Computing layout...", "Cancel", 0, 0, parent)
+        progress.setWindowTitle("GRN Plot")
+        progress.show()
 
-        # Partition nodes:
-        input_nodes = [n for n,d in self.G.nodes(data=True) if d.get("node_type") == "input"]
-        output_nodes = [n for n,d in self.G.nodes(data=True) if d.get("node_type") == "output"]
-        normal_nodes = [n for n in self.G.nodes if n not in input_nodes and n not in output_nodes]
+        # All-pairs repulsion is fine for small networks; approximate it above the cutoff
+        if self.G.number_of_nodes() > self.EXACT_LAYOUT_MAX_NODES:
+            layout = self._barnes_hut_fr
+        else:
+            layout = self._lbfgs_spring_layout
+        worker = LayoutWorker(layout, self.G.copy())  # the pool thread only ever sees a snapshot
+        signals = worker.signals
+        signals.finished.connect(lambda pos: self._on_layout_ready(signature, pos, progress, parent, signals))
+        self._layout_signals.add(signals)  # keep the signal source alive until it fires
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_layout_ready(self, signature, pos, progress, parent=None, signals=None):
+        self._layout_signals.discard(signals)
+        canceled = progress.wasCanceled()
+        progress.close()
+        progress.deleteLater()
+        if pos is None:
+            if not canceled:
+                QMessageBox.warning(parent, "Plot Error", "Computing the GRN layout failed.")
+            return
+        self._layout_cache[signature] = pos
+        self._layout_cache.move_to_end(signature)
+        while len(self._layout_cache) > self.LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        # Skip drawing if cancelled, or if the graph was rebuilt while the layout was running
+        if canceled or signature != self._graph_signature():
+            return
+        self._draw_network(pos, parent)
+
+    def _draw_network(self, pos, parent=None):
+        # Partition nodes in a single pass:
+        input_nodes, output_nodes, normal_nodes = [], [], []
+        for n, d in self.G.nodes(data=True):
+            node_type = d.get("node_type")
+            if node_type == "input":
+                input_nodes.append(n)
+            elif node_type == "output":
+                output_nodes.append(n)
+            else:
+                normal_nodes.append(n)
+
+        # Edges
+        colors = [self.EDGE_COLORS.get(data.get("regType", 0), "orange") for _, _, data in self.G.edges(data=True)]
+
+        try:
+            import pyqtgraph as pg
+        except ImportError:
+            self._plot_network_matplotlib(pos, input_nodes, output_nodes, normal_nodes, colors)
+            return
+
+        node_colors = dict.fromkeys(normal_nodes, "gray")
+        node_colors.update(dict.fromkeys(input_nodes, "green"))
+        node_colors.update(dict.fromkeys(output_nodes, "purple"))
+        self._plot_network_pyqtgraph(pg, pos, node_colors, colors, parent)
+
+    def _plot_network_pyqtgraph(self, pg, pos, node_colors, edge_colors, parent=None):
+        nodes = list(self.G.nodes)
+        index = {n: i for i, n in enumerate(nodes)}
+        coords = np.asarray([pos[n] for n in nodes], dtype=float)
+
+        dialog = QDialog(parent)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)  # free the pyqtgraph scene when the viewer is closed
+        dialog.setWindowTitle("GRN Plot")
+        dialog.resize(600, 600)
+        layout = QVBoxLayout(dialog)
+        plot_widget = pg.GraphicsLayoutWidget()
+        layout.addWidget(plot_widget)
+        view = plot_widget.addViewBox()
+        view.setAspectLocked()
+
+        graph = pg.GraphItem()
+        view.addItem(graph)
+        graph_data = {"pos": coords, "size": 30, "symbol": "o", "pxMode": True,
+                      "symbolBrush": [pg.mkBrush(node_colors[n]) for n in nodes]}
+        if edge_colors:
+            # One pen per edge, as a structured array as expected by GraphItem
+            graph_data["adj"] = np.asarray([(index[u], index[v]) for u, v in self.G.edges], dtype=int)
+            graph_data["pen"] = np.array(
+                [QColor(c).getRgb() + (2,) for c in edge_colors],
+                dtype=[("red", np.ubyte), ("green", np.ubyte), ("blue", np.ubyte), ("alpha", np.ubyte), ("width", float)]
+            )
+        graph.setData(**graph_data)
+
+        for n, (x, y) in zip(nodes, coords):
+            label = pg.TextItem(str(n), color="w", anchor=(0.5, 0.5))
+            label.setPos(x, y)
+            view.addItem(label)
+
+        # Arrow heads part-way along each edge (ArrowItem angle 0 points left)
+        for (i, j), color in zip(graph_data.get("adj", ()), edge_colors):
+            (x0, y0), (x1, y1) = coords[i], coords[j]
+            angle = 180 - math.degrees(math.atan2(y1 - y0, x1 - x0))
+            arrow = pg.ArrowItem(angle=angle, headLen=12, tailLen=None, pen=color, brush=color)
+            arrow.setPos(x0 + 0.75 * (x1 - x0), y0 + 0.75 * (y1 - y0))
+            view.addItem(arrow)
+
+        # Keep a reference so the modeless dialog is not garbage collected
+        self._viewer = dialog
+        dialog.show()
+
+    def _plot_network_matplotlib(self, pos, input_nodes, output_nodes, normal_nodes, colors):
+        import networkx as nx
+        _use_qt_backend()
+        import matplotlib.pyplot as plt
 
         nx.draw_networkx_nodes(self.G, pos, nodelist=input_nodes, node_color="green")
         nx.draw_networkx_nodes(self.G, pos, nodelist=output_nodes, node_color="purple")
         nx.draw_networkx_nodes(self.G, pos, nodelist=normal_nodes, node_color="gray")
 
-        # Edges
-        colors = []
-        for (u,v,data) in self.G.edges(data=True):
-            rt = data.get("regType", 0)
-            if rt == 1:
-                colors.append("blue")
-            elif rt == -1:
-                colors.append("red")
-            else:
-                colors.append("orange")
         nx.draw_networkx_edges(self.G, pos, edge_color=colors, arrows=True)
 
         nx.draw_networkx_labels(self.G, pos, font_color="white")
@@ -98,6 +463,8 @@ class NodeItem(QGraphicsEllipseItem):
     can update their positions when this node moves.
     """
 
+    FONT = QFont("Consolas", 10)  # shared by all nodes
+
     def __init__(self, x, y, diameter=50, node_data=None):
         super().__init__(0, 0, diameter, diameter)
         self.setPos(x, y)
@@ -112,21 +479,31 @@ class NodeItem(QGraphicsEllipseItem):
         if node_data is None:
             node_data = {"label": "Node", "node_type": "normal"}
         self.node_data = node_data
+        self.sync_node_data()
 
-        self.edges = []
+        self.edges = set()
         self.diameter = diameter
-        self.font = QFont("Consolas", 10)
 
         # Color based on node_type
-        node_type = self.node_data.get("node_type", "normal")
+        node_type = self._node_type
         if node_type == "input":
-            self.setBrush(QBrush(QColor("#006600")))  # green
+            self.setBrush(BRUSH_INPUT)
         elif node_type == "output":
-            self.setBrush(QBrush(QColor("#660066")))  # purple
+            self.setBrush(BRUSH_OUTPUT)
         else:
-            self.setBrush(QBrush(QColor("#444444")))  # normal -> dark gray
+            self.setBrush(BRUSH_NORMAL)
 
-        self.setPen(QPen(Qt.black, 1))
+        self.setPen(PEN_BLACK)
+
+        # Reuse the rendered node bitmap until the label, brush or pen changes
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def sync_node_data(self):
+        """
+        Refresh the cached label / node_type attributes. Call after node_data changes.
+        """
+        self._label = self.node_data.get("label", "Node")
+        self._node_type = self.node_data.get("node_type", "normal")
 
     def boundingRect(self):
         return QRectF(0, 0, self.diameter, self.diameter)
@@ -134,86 +511,60 @@ class NodeItem(QGraphicsEllipseItem):
     def paint(self, painter, option, widget=None):
         super().paint(painter, option, widget)
         # Draw label
-        label = self.node_data.get("label", "Node")
-        painter.setFont(self.font)
+        painter.setFont(NodeItem.FONT)
         painter.setPen(Qt.white)
-        painter.drawText(self.boundingRect(), Qt.AlignCenter, label)
+        painter.drawText(self.boundingRect(), Qt.AlignCenter, self._label)
 
     def add_edge(self, edge):
-        if edge not in self.edges:
-            self.edges.append(edge)
+        self.edges.add(edge)
 
     def remove_edge(self, edge):
-        if edge in self.edges:
-            self.edges.remove(edge)
+        self.edges.discard(edge)
 
     def itemChange(self, change, value):
         """
         Called whenever the node's position (or other states) changes.
         We only care about position changes so we can update connected edges.
+        Edge updates are handed to the scene, which coalesces them per event-loop tick.
         """
-        if change == QGraphicsItem.ItemPositionChange:
-            for edge in self.edges:
-                edge.update_positions()
+        if change == QGraphicsItem.ItemPositionHasChanged and self.edges:
+            scene = self.scene()
+            if scene is not None:
+                scene.mark_edges_dirty(self.edges)
+            else:
+                for edge in self.edges:
+                    edge.update_positions()
         return super().itemChange(change, value)
 
     def mouseDoubleClickEvent(self, event):
         """
-        Double-click a node to rename it.
+        Double-click a node to edit its name and parameters in one dialog.
         """
-        current_label = self.node_data.get("label", "")
-        new_label, ok = QInputDialog.getText(
-            None, "Edit Node Name",
-            "Node Name:",
-            text=current_label
-        )
-        if ok and new_label.strip():
-            self.node_data["label"] = new_label.strip()
+        dialog = NodeEditDialog(self.node_data)
+        if dialog.exec_() == QDialog.Accepted:
+            self.node_data.update(dialog.values())
+            self.sync_node_data()
             self.update()
-        
-        if self.node_data["node_type"] == "gene":
-            current_alpha = self.node_data.get("alpha", 10)
-            new_alpha, ok = QInputDialog.getInt(
-                None, "Edit Alpha",
-                "Alpha:",
-                value=current_alpha
-            )
-            if ok:
-                self.node_data["alpha"] = new_alpha
-                self.update()
-            
-            current_logic = self.node_data.get("logic_type", "and")
-            new_logic, ok = QInputDialog.getText(
-                None, "Edit Logic Type",
-                "Logic Type ('and', 'or'):",
-                text=current_logic
-            )
-            if ok and new_logic in ['and', 'or']:
-                self.node_data["logic_type"] = new_logic
-                self.update()
-            elif ok:
-                print("Error: Logic type should be either 'and' / 'or'.")
-        elif self.node_data["node_type"] == "output":
-            current_deg_rate = self.node_data.get("deg_rate", 0.1)
-            new_deg_rate, ok = QInputDialog.getDouble(
-                None, "Edit degradation rate",
-                "Degradation rate:",
-                value=current_deg_rate
-            )
-            if ok and new_deg_rate is not None:
-                self.node_data["deg_rate"] = new_deg_rate
-                self.update()
-        
+            if self.scene() is not None:
+                self.scene().mark_modified()
+
         super().mouseDoubleClickEvent(event)
 
 
 # ---------------------------------------------------
 # 3) EdgeItem: a line with arrow
 # ---------------------------------------------------
-class EdgeItem(QGraphicsLineItem):
+# Arrow head half-angle (30 degrees), precomputed for update_positions
+_COS30 = math.cos(math.radians(30))
+_SIN30 = math.sin(math.radians(30))
+
+class EdgeItem(QGraphicsPathItem):
     """
     Directed edge from source_node -> target_node.
     We'll store minimal data in edge_data if needed.
+
+    The line and arrow head live in a single cached QPainterPath, so Qt
+    draws, culls and hit-tests the edge without a custom paint().
     
     Double-click to edit the edge data: 'type', 'Kd', 'n'.
     """
@@ -232,15 +583,7 @@ class EdgeItem(QGraphicsLineItem):
             "n": 1.0
         }
 
-        # Styling
-        self.pen_inactive = QPen(QColor("gray"), 3)
-        self.pen_active = QPen(QColor("cyan"), 3)
-
-        # Styling
-        self.pen_inactive_activation = QPen(QColor("blue"), 3)  # Green for activation
-        self.pen_inactive_repression = QPen(QColor("red"), 3)   # Red for repression
-
-        self.setPen(self.get_inactive_pen())
+        self.refresh_pen()
         self.setFlags(self.ItemIsSelectable)
 
         # Register with source
@@ -257,15 +600,23 @@ class EdgeItem(QGraphicsLineItem):
         self.target_node = node
         self.target_node.add_edge(self)
         self.update_positions()
+        if self.scene() is not None:
+            self.scene().mark_modified()
 
     def get_inactive_pen(self):
         """
         Returns the inactive pen color based on the edge type.
         """
         if self.edge_data["type"] == 1:
-            return self.pen_inactive_activation
+            return PEN_ACTIVATION
         else:
-            return self.pen_inactive_repression
+            return PEN_REPRESSION
+
+    def refresh_pen(self):
+        """
+        Apply the pen for the current edge type. Call after edge_data["type"] changes.
+        """
+        self.setPen(self.get_inactive_pen())
 
     def update_positions(self):
         """
@@ -280,91 +631,179 @@ class EdgeItem(QGraphicsLineItem):
             tx = self.target_node.x() + self.target_node.diameter / 2
             ty = self.target_node.y() + self.target_node.diameter / 2
 
-            # Calculate the angle between source and target
-            angle = math.atan2(ty - sy, tx - sx)
+            # Unit direction from source to target (cos / sin of the edge angle)
+            length = math.hypot(tx - sx, ty - sy)
+            if length:
+                cos_a = (tx - sx) / length
+                sin_a = (ty - sy) / length
+            else:
+                cos_a, sin_a = 1.0, 0.0
 
             # Adjust the positions to be at the edge of the circles
-            sx += (self.source_node.diameter / 2) * math.cos(angle)
-            sy += (self.source_node.diameter / 2) * math.sin(angle)
-            tx -= (self.target_node.diameter / 2) * math.cos(angle)
-            ty -= (self.target_node.diameter / 2) * math.sin(angle)
+            sx += (self.source_node.diameter / 2) * cos_a
+            sy += (self.source_node.diameter / 2) * sin_a
+            tx -= (self.target_node.diameter / 2) * cos_a
+            ty -= (self.target_node.diameter / 2) * sin_a
         else:
             tx, ty = sx, sy
 
-        self.setLine(sx, sy, tx, ty)
-
-    def paint(self, painter, option, widget=None):
-
-        pen = self.pen()
-
-        # Highlight if selected
-        if self.isSelected():
-            painter.setPen(self.pen_active.color())
-        else:
-            painter.setPen(self.get_inactive_pen().color())
-
-        painter.setPen(pen)
-        line = self.line()
-        painter.drawLine(line)
+        # Path coordinates are passed as plain floats, no QPointF / QPolygonF temporaries
+        path = QPainterPath()
+        path.moveTo(sx, sy)
+        path.lineTo(tx, ty)
 
-        # Draw arrow if we have a target
+        # Append the arrow head if we have a target
         if self.target_node:
-            angle = math.atan2(line.dy(), line.dx())
             arrow_size = 12
 
-            ex, ey = line.x2(), line.y2()
-            arrow_angle = math.radians(30)
+            # Wings at +-30 degrees via the angle-sum identities, no trig calls
+            path.moveTo(tx, ty)
+            path.lineTo(tx - arrow_size * (cos_a * _COS30 + sin_a * _SIN30),
+                        ty - arrow_size * (sin_a * _COS30 - cos_a * _SIN30))
+            path.lineTo(tx - arrow_size * (cos_a * _COS30 - sin_a * _SIN30),
+                        ty - arrow_size * (sin_a * _COS30 + cos_a * _SIN30))
+            path.closeSubpath()
 
-            p1 = QPointF(
-                ex - arrow_size * math.cos(angle - arrow_angle),
-                ey - arrow_size * math.sin(angle - arrow_angle)
-            )
-            p2 = QPointF(
-                ex - arrow_size * math.cos(angle + arrow_angle),
-                ey - arrow_size * math.sin(angle + arrow_angle)
-            )
+        self.setPath(path)
 
-            polygon = QPolygonF([QPointF(ex, ey), p1, p2])
-            painter.drawPolygon(polygon)
-
-        super().paint(painter, option, widget)
+    def set_line(self, sx, sy, tx, ty):
+        """
+        Draw a plain segment without an arrow head, e.g. while the edge is being dragged.
+        """
+        path = QPainterPath()
+        path.moveTo(sx, sy)
+        path.lineTo(tx, ty)
+        self.setPath(path)
 
     def mouseDoubleClickEvent(self, event):
         """
         Double-click an edge to edit its data: type, Kd, n.
         """
-        # Edit 'type'
-        current_type = self.edge_data.get("type", 0)
-        new_type, ok = QInputDialog.getInt(None, "Edit Edge Type",
-                                           "Type (-1 or 1):",
-                                           value=current_type)
-        if ok and new_type in [-1, 1]:
-            self.edge_data["type"] = new_type
-            self.setPen(self.get_inactive_pen())
+        dialog = EdgeEditDialog(self.edge_data)
+        if dialog.exec_() == QDialog.Accepted:
+            values = dialog.values()
+            type_changed = values["type"] != self.edge_data.get("type")
+            self.edge_data.update(values)
+            if type_changed:
+                self.refresh_pen()
             self.update()
-        elif ok:
-            print("Error: Edge type should be either -1 / 1.")
-
-        # Edit 'Kd'
-        current_kd = self.edge_data.get("Kd", 1.0)
-        new_kd, ok = QInputDialog.getDouble(None, "Edit Edge Kd",
-                                            "Kd value:",
-                                            value=current_kd)
-        if ok:
-            self.edge_data["Kd"] = new_kd
-
-        # Edit 'n'
-        current_n = self.edge_data.get("n", 1.0)
-        new_n, ok = QInputDialog.getDouble(None, "Edit Edge n",
-                                           "Hill coefficient n:",
-                                           value=current_n)
-        
-        if ok:
-            self.edge_data["n"] = new_n
+            if self.scene() is not None:
+                self.scene().mark_modified()
 
         super().mouseDoubleClickEvent(event)
 
 
+# ---------------------------------------------------
+# 3a) Dialogs for editing node / edge data
+# ---------------------------------------------------
+class NodeEditDialog(QDialog):
+    """
+    One form for a node's name plus its type-specific parameters:
+    alpha and logic type for genes, degradation rate for outputs.
+    """
+
+    def __init__(self, node_data, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Node")
+        self.node_type = node_data.get("node_type")
+        form = QFormLayout(self)
+
+        self.label_edit = QLineEdit(node_data.get("label", ""))
+        form.addRow("Node Name:", self.label_edit)
+
+        if self.node_type == "gene":
+            self.alpha_edit = QDoubleSpinBox()
+            self.alpha_edit.setDecimals(4)
+            self.alpha_edit.setRange(0, 1000000)
+            self.alpha_edit.setValue(float(node_data.get("alpha", 10)))
+            form.addRow("Alpha:", self.alpha_edit)
+
+            logic_type = node_data.get("logic_type", "and")
+            self.logic_edit = QComboBox()
+            self.logic_edit.addItems(["and", "or", "mixed"])
+            if self.logic_edit.findText(logic_type) < 0:
+                self.logic_edit.addItem(logic_type)  # keep values imported from GraphML selectable
+            self.logic_edit.setCurrentText(logic_type)
+            form.addRow("Logic Type:", self.logic_edit)
+        elif self.node_type == "output":
+            self.deg_rate_edit = QDoubleSpinBox()
+            self.deg_rate_edit.setDecimals(4)
+            self.deg_rate_edit.setRange(0, 1000000)
+            self.deg_rate_edit.setValue(float(node_data.get("deg_rate", 0.1)))
+            form.addRow("Degradation rate:", self.deg_rate_edit)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+
+        self._initial = self._field_values()
+
+    def _field_values(self):
+        values = {"label": self.label_edit.text().strip()}
+        if self.node_type == "gene":
+            values["alpha"] = self.alpha_edit.value()
+            values["logic_type"] = self.logic_edit.currentText()
+        elif self.node_type == "output":
+            values["deg_rate"] = self.deg_rate_edit.value()
+        return values
+
+    def values(self):
+        """
+        Return the fields the user changed as a dict to merge into node_data,
+        so untouched parameters keep their exact stored values.
+        An empty name keeps the current label.
+        """
+        values = {key: value for key, value in self._field_values().items() if value != self._initial[key]}
+        if not values.get("label", True):
+            del values["label"]
+        return values
+
+
+class EdgeEditDialog(QDialog):
+    """
+    One form for an edge's type (activation / repression), Kd and Hill coefficient n.
+    """
+
+    def __init__(self, edge_data, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Edge")
+        form = QFormLayout(self)
+
+        self.type_edit = QComboBox()
+        self.type_edit.addItem("Activation (1)", 1)
+        self.type_edit.addItem("Repression (-1)", -1)
+        self.type_edit.setCurrentIndex(0 if edge_data.get("type", 1) == 1 else 1)
+        form.addRow("Type:", self.type_edit)
+
+        self.kd_edit = QDoubleSpinBox()
+        self.kd_edit.setDecimals(4)
+        self.kd_edit.setRange(0, 1000000)
+        self.kd_edit.setValue(float(edge_data.get("Kd", 1.0)))
+        form.addRow("Kd value:", self.kd_edit)
+
+        self.n_edit = QDoubleSpinBox()
+        self.n_edit.setDecimals(4)
+        self.n_edit.setRange(0, 1000000)
+        self.n_edit.setValue(float(edge_data.get("n", 1.0)))
+        form.addRow("Hill coefficient n:", self.n_edit)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+
+    def values(self):
+        """
+        Return the edited fields as a dict to merge into edge_data.
+        """
+        return {
+            "type": self.type_edit.currentData(),
+            "Kd": self.kd_edit.value(),
+            "n": self.n_edit.value()
+        }
+
+
 # ---------------------------------------------------
 # 4) GraphScene: with "edge mode" + pinning
 # ---------------------------------------------------
@@ -379,6 +818,7 @@ class GraphScene(QGraphicsScene):
     """
 
     SNAP_DISTANCE = 40  # how close we must be to "pin" a node
+    SNAP_DISTANCE_SQ = SNAP_DISTANCE * SNAP_DISTANCE
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -387,6 +827,60 @@ class GraphScene(QGraphicsScene):
         self.source_node = None
 
         self.pinned_node = None  # the node currently pinned (hover target)
+        self.view = None  # main view used for hit-testing, set by MainWindow
+
+        # Region queries in find_nearest_node rely on the BSP tree index
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+
+        # NodeItems / EdgeItems currently in the scene, kept in sync by addItem/removeItem.
+        # Dicts are used as insertion-ordered sets so iteration follows creation order.
+        self.nodes = {}
+        self.edges = {}
+
+        # Edges whose endpoints moved since the last flush
+        self._dirty_edges = set()
+        self._flush_scheduled = False
+
+        # Bumped on every change that affects the GRN (topology or node / edge data)
+        self.revision = 0
+
+    def mark_modified(self):
+        self.revision += 1
+
+    def addItem(self, item):
+        super().addItem(item)
+        if isinstance(item, NodeItem):
+            self.nodes[item] = None
+        elif isinstance(item, EdgeItem):
+            self.edges[item] = None
+        self.mark_modified()
+
+    def removeItem(self, item):
+        super().removeItem(item)
+        self.nodes.pop(item, None)
+        self.edges.pop(item, None)
+        self.mark_modified()
+
+    def clear(self):
+        super().clear()
+        self.nodes.clear()
+        self.edges.clear()
+        self._dirty_edges.clear()
+        self.mark_modified()
+
+    def mark_edges_dirty(self, edges):
+        """Queue `edges` for a single update_positions() on the next event-loop tick."""
+        self._dirty_edges.update(edges)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush_dirty_edges)
+
+    def flush_dirty_edges(self):
+        self._flush_scheduled = False
+        dirty, self._dirty_edges = self._dirty_edges, set()
+        for edge in dirty:
+            if edge.scene() is self:
+                edge.update_positions()
 
     def set_edge_mode(self, enabled: bool):
         self.edge_mode = enabled
@@ -401,33 +895,41 @@ class GraphScene(QGraphicsScene):
     def clear_pinned_node(self):
         """Remove any highlight from the currently pinned node."""
         if self.pinned_node:
-            self.pinned_node.setPen(QPen(Qt.black, 1))
+            self.pinned_node.setPen(PEN_BLACK)
         self.pinned_node = None
 
     def find_nearest_node(self, pos: QPointF):
         """
-        Search all NodeItem in the scene. 
+        Query the scene index for NodeItems around `pos`.
         Return the node whose center is within SNAP_DISTANCE, else None.
         """
+        if not self.edge_mode:
+            return None
+
+        snap = self.SNAP_DISTANCE
+        px, py = pos.x(), pos.y()
+        region = QRectF(px - snap, py - snap, 2 * snap, 2 * snap)
         closest_node = None
-        closest_dist = self.SNAP_DISTANCE
-        for item in self.items():
+        closest_dist_sq = self.SNAP_DISTANCE_SQ
+        for item in self.items(region, Qt.IntersectsItemBoundingRect):
             if isinstance(item, NodeItem):
-                # center of item
-                cx = item.x() + item.diameter/2
-                cy = item.y() + item.diameter/2
-                dx = pos.x() - cx
-                dy = pos.y() - cy
-                dist = math.hypot(dx, dy)
-                if dist < closest_dist:
-                    closest_dist = dist
+                # offset to center of item; squared distances order the same as distances
+                radius = item.diameter/2
+                dx = px - item.x() - radius
+                dy = py - item.y() - radius
+                d2 = dx*dx + dy*dy
+                if d2 < closest_dist_sq:
+                    closest_dist_sq = d2
                     closest_node = item
         return closest_node
 
     def mousePressEvent(self, event):
-        if self.edge_mode:
-            # check if we clicked on a NodeItem
-            item = self.itemAt(event.scenePos(), self.views()[0].transform())
+        if not self.edge_mode:
+            return super().mousePressEvent(event)
+
+        # check if we clicked on a NodeItem (edges may be stacked above it)
+        transform = self.view.transform() if self.view is not None else QTransform()
+        for item in self.items(event.scenePos(), Qt.IntersectsItemShape, Qt.DescendingOrder, transform):
             if isinstance(item, NodeItem):
                 self.source_node = item
                 # create a temporary edge
@@ -449,7 +951,7 @@ class GraphScene(QGraphicsScene):
                 ny = nearest.y() + nearest.diameter/2
                 sx = self.source_node.x() + self.source_node.diameter/2
                 sy = self.source_node.y() + self.source_node.diameter/2
-                self.temp_edge.setLine(sx, sy, nx, ny)
+                self.temp_edge.set_line(sx, sy, nx, ny)
             else:
                 # no pinned node => unpin
                 self.clear_pinned_node()
@@ -457,7 +959,7 @@ class GraphScene(QGraphicsScene):
                 sx = self.source_node.x() + self.source_node.diameter/2
                 sy = self.source_node.y() + self.source_node.diameter/2
                 mx, my = event.scenePos().x(), event.scenePos().y()
-                self.temp_edge.setLine(sx, sy, mx, my)
+                self.temp_edge.set_line(sx, sy, mx, my)
 
             event.accept()
             return
@@ -469,7 +971,7 @@ class GraphScene(QGraphicsScene):
             return
         self.clear_pinned_node()
         self.pinned_node = node
-        self.pinned_node.setPen(QPen(QColor("cyan"), 2))
+        self.pinned_node.setPen(PEN_PINNED)
 
     def mouseReleaseEvent(self, event):
         if self.edge_mode and self.temp_edge and self.source_node:
@@ -488,9 +990,94 @@ class GraphScene(QGraphicsScene):
         super().mouseReleaseEvent(event)
 
 
+# ---------------------------------------------------
+# 4a) SimStateModel: input states for the simulation
+# ---------------------------------------------------
+class SimStateModel(QAbstractTableModel):
+    """
+    Input node states per simulation interval: rows are input nodes,
+    columns are intervals. Backed by an int32 array so plot_simulation
+    can hand it to the simulator without per-cell conversion.
+    """
+
+    DEFAULT_STATE = 50
+
+    def __init__(self, labels, parent=None):
+        super().__init__(parent)
+        self.labels = list(labels)
+        self.states = np.empty((len(self.labels), 0), dtype=np.int32)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.states.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.states.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return int(self.states[index.row(), index.column()])
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole:
+            return False
+        try:
+            self.states[index.row(), index.column()] = int(value)
+        except (TypeError, ValueError):
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return f"Interval {section + 1}"
+        return self.labels[section]
+
+    def add_interval(self):
+        """Append an interval column with every input at DEFAULT_STATE."""
+        column = self.states.shape[1]
+        self.beginInsertColumns(QModelIndex(), column, column)
+        self.states = np.column_stack([self.states, np.full(len(self.labels), self.DEFAULT_STATE, dtype=np.int32)])
+        self.endInsertColumns()
+
+
 # ---------------------------------------------------
 # 5) MainWindow with a toolbar for edge mode, etc.
 # ---------------------------------------------------
+@contextmanager
+def _updates_paused(view):
+    """
+    Suppress repaints of `view` during a bulk scene edit, then repaint once.
+    """
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
+# Below this many removals, per-item BSP updates beat rebuilding the whole tree on resume
+INDEX_PAUSE_THRESHOLD = 50
+
+
+@contextmanager
+def _index_paused(scene):
+    """
+    Switch off the scene's BSP index during a bulk add/remove; it is rebuilt once on exit.
+    """
+    scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+    try:
+        yield
+    finally:
+        scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -500,6 +1087,7 @@ class MainWindow(QMainWindow):
         self.scene = GraphScene()
         self.scene.setSceneRect(0, 0, 1200, 800)
         self.view = QGraphicsView(self.scene)
+        self.scene.view = self.view
         self.view.setRenderHint(QPainter.Antialiasing)
         self.setCentralWidget(self.view)
 
@@ -516,6 +1104,9 @@ class MainWindow(QMainWindow):
         self.simulation_duration = 100
         self.simulation_intervals = []
         self.node_inputs = {}
+        self._grn_cache = None  # (scene revision, grn) from the last build_grn
+        self._network = None  # MyGRN reused by "Plot GRN", created on first use
+        self._network_revision = None  # scene revision self._network was built from
 
         # b) Toolbar
         self.toolbar = QToolBar("Tools")
@@ -601,20 +1192,29 @@ class MainWindow(QMainWindow):
 
     def delete_selected_node(self):
         selected_items = self.scene.selectedItems()
-        for item in selected_items:
-            if isinstance(item, NodeItem):
-                label = item.node_data.get("label")
-                if label in self.node_inputs:
-                    del self.node_inputs[label]
-                for edge in item.edges[:]:
-                    self.scene.removeItem(edge)
-                self.scene.removeItem(item)
+        removals = sum(1 + len(item.edges) for item in selected_items if isinstance(item, NodeItem))
+        bulk = _index_paused(self.scene) if removals > INDEX_PAUSE_THRESHOLD else nullcontext()
+        with _updates_paused(self.view), bulk:
+            for item in selected_items:
+                if isinstance(item, NodeItem):
+                    label = item.node_data.get("label")
+                    if label in self.node_inputs:
+                        del self.node_inputs[label]
+                    for edge in list(item.edges):
+                        # detach from both ends so a selected neighbour doesn't remove it again
+                        edge.source_node.remove_edge(edge)
+                        if edge.target_node is not None:
+                            edge.target_node.remove_edge(edge)
+                        self.scene.removeItem(edge)
+                    self.scene.removeItem(item)
 
     def delete_selected_edge(self):
         selected_items = self.scene.selectedItems()
-        for item in selected_items:
-            if isinstance(item, EdgeItem):
-                self.scene.removeItem(item)
+        bulk = _index_paused(self.scene) if len(selected_items) > INDEX_PAUSE_THRESHOLD else nullcontext()
+        with bulk:
+            for item in selected_items:
+                if isinstance(item, EdgeItem):
+                    self.scene.removeItem(item)
 
     # --- Simulation GUI ---
     def open_simulation_gui(self):
@@ -624,15 +1224,10 @@ class MainWindow(QMainWindow):
 
         layout = QVBoxLayout()
 
-        # Node Input Table
-        self.node_table = QTableWidget()
-        self.node_table.setColumnCount(1)
-        self.node_table.setHorizontalHeaderLabels(["Node"])
-        self.node_table.setRowCount(len(self.node_inputs))
-        for row, node in enumerate(self.node_inputs.keys()):
-            item = QTableWidgetItem(self.node_inputs[node].node_data["label"])
-            item.setFlags(Qt.ItemIsEnabled)  # Make node names uneditable
-            self.node_table.setItem(row, 0, item)
+        # Node Input Table (node names are the row headers, one column per interval)
+        self.sim_model = SimStateModel(node.node_data["label"] for node in self.node_inputs.values())
+        self.node_table = QTableView()
+        self.node_table.setModel(self.sim_model)
         layout.addWidget(self.node_table)
 
         # Add Interval States Button
@@ -655,16 +1250,13 @@ class MainWindow(QMainWindow):
         self.sim_window.show()
 
     def add_interval_column(self):
-        column_count = self.node_table.columnCount()
-        self.node_table.insertColumn(column_count)
-        self.node_table.setHorizontalHeaderItem(column_count, QTableWidgetItem(f"Interval {column_count}"))
-        for row in range(self.node_table.rowCount()):
-            self.node_table.setItem(row, column_count, QTableWidgetItem("50"))
+        self.sim_model.add_interval()
 
     def import_nx_graph(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open NX Graph (GraphML File)", "", "GraphML Files (*.graphml)")
         if file_name:
-            self.graph = nx.read_graphml(file_name)
+            import networkx as nx
+            self.graph = nx.read_graphml(file_name, node_type=str)
             self.scene.clear()
             self.node_inputs.clear()
             self.input_counter = 1
@@ -674,102 +1266,144 @@ class MainWindow(QMainWindow):
             self.gene_position = [200, 50]
             self.output_position = [400, 50]
 
-            for node, data in self.graph.nodes(data=True):
-                node_type = data.get('node_type', 'normal')
-                x = data.get('x', 0)
-                y = data.get('y', 0)
-                node_data = {"label": node, "node_type": node_type}
-                node_data.update(data)
-                node_item = NodeItem(x, y, diameter=50, node_data=node_data)
-                self.scene.addItem(node_item)
-                if node_type == 'input':
-                    self.node_inputs[node] = node_item
-
-            for source, target, data in self.graph.edges(data=True):
-                source_node = next(item for item in self.scene.items() if isinstance(item, NodeItem) and item.node_data['label'] == source)
-                target_node = next(item for item in self.scene.items() if isinstance(item, NodeItem) and item.node_data['label'] == target)
-                edge_item = EdgeItem(source_node, target_node)
-                edge_item.edge_data.update(data)
-                edge_item.setPen(edge_item.get_inactive_pen())
-                self.scene.addItem(edge_item)
+            # Bulk insert without index maintenance or repaints; the BSP tree is rebuilt once at the end
+            with _updates_paused(self.view), _index_paused(self.scene):
+                self.scene.blockSignals(True)
+                try:
+                    label_to_node = {} # Index nodes by label for O(1) edge endpoint lookup
+                    for node, data in self.graph.nodes(data=True):
+                        # Reuse the parsed attribute dict as node_data; position lives on the item
+                        x = data.pop('x', 0)
+                        y = data.pop('y', 0)
+                        data.setdefault('label', node)
+                        node_type = data.setdefault('node_type', 'normal')
+                        node_item = NodeItem(x, y, diameter=50, node_data=data)
+                        self.scene.addItem(node_item)
+                        label_to_node[node] = node_item
+                        if node_type == 'input':
+                            self.node_inputs[node] = node_item
+
+                    for source, target, data in self.graph.edges(data=True):
+                        source_node = label_to_node[source]
+                        target_node = label_to_node[target]
+                        edge_item = EdgeItem(source_node, target_node)
+                        edge_item.edge_data.update(data)
+                        edge_item.refresh_pen()
+                        self.scene.addItem(edge_item)
+                finally:
+                    self.scene.blockSignals(False)
 
             QMessageBox.information(self, "Import Complete", f"NX Graph imported from {file_name}")
 
     def export_nx_graph(self):
         file_name, _ = QFileDialog.getSaveFileName(self, "Save NX Graph (GraphML File)", "", "GraphML Files (*.graphml)")
         if file_name:
+            import networkx as nx
             graph = nx.DiGraph()
-            for item in self.scene.items():
-                if isinstance(item, NodeItem):
-                    node_data = item.node_data.copy()
-                    node_data['x'] = item.x()
-                    node_data['y'] = item.y()
-                    graph.add_node(item.node_data['label'], **node_data)
-                elif isinstance(item, EdgeItem):
+            for item in self.scene.nodes:
+                node_data = item.node_data.copy()
+                node_data['x'] = item.x()
+                node_data['y'] = item.y()
+                graph.add_node(item.node_data['label'], **node_data)
+            for item in self.scene.edges:
+                if item.target_node is not None:
                     graph.add_edge(item.source_node.node_data['label'], item.target_node.node_data['label'], **item.edge_data)
             nx.write_graphml(graph, file_name)
             QMessageBox.information(self, "Export Complete", f"NX Graph exported to {file_name}")
 
 
     def build_grn(self):
+        # Reuse the last GRN while the scene is unchanged
+        if self._grn_cache is not None and self._grn_cache[0] == self.scene.revision:
+            return self._grn_cache[1]
+
+        _use_qt_backend() # grn imports pyplot at module level
         import grn
 
         my_grn = grn.grn()
 
-        for item in self.scene.items():
-            if isinstance(item, NodeItem) and item.node_data.get('node_type') == 'input':
-                my_grn.add_input_species(item.node_data.get('label'))
+        # Bin nodes by type and edges by endpoint in one pass over each cached collection
+        inputs, outputs, genes = [], [], []
+        incoming = defaultdict(list)
+        outgoing = defaultdict(list)
+        for item in self.scene.nodes:
+            node_type = item._node_type
+            if node_type == 'input':
+                inputs.append(item)
+            elif node_type == 'output':
+                outputs.append(item)
+            elif node_type == 'gene':
+                genes.append(item)
+        for item in self.scene.edges:
+            if item.target_node is not None:
+                outgoing[item.source_node].append(item)
+                if item.target_node is not item.source_node:
+                    incoming[item.target_node].append(item)
+
+        for item in inputs:
+            my_grn.add_input_species(item._label)
 
         # Add output species
-        for item in self.scene.items():
-            if isinstance(item, NodeItem) and item.node_data.get('node_type') == 'output':
-                my_grn.add_species(item.node_data.get('label'), item.node_data.get('deg_rate'))
-
-        for geneNodes in self.scene.items():
-            if isinstance(geneNodes, NodeItem) and geneNodes.node_data.get('node_type') == 'gene':
-                regulators = [] # Map incomming edges to regulators
-                products = [] # Map outgoing edges to products
-                for edge in self.scene.items():
-                    if isinstance(edge, EdgeItem):
-                        sourceNode = edge.source_node
-                        targetNode = edge.target_node
-
-                        if (sourceNode == geneNodes):
-                            products.append({'name': targetNode.node_data.get('label')})
-                        elif (targetNode == geneNodes):
-                            src_label = edge.source_node.node_data.get('label')
-                            edge_type = edge.edge_data.get("type", 1)
-                            edge_kd = edge.edge_data.get("Kd", 1.0)
-                            edge_n = edge.edge_data.get("n", 1.0)
-                            regulators.append({'name': src_label, 'type': edge_type, 'Kd': edge_kd, 'n': edge_n})
-
-                alpha = geneNodes.node_data.get('alpha', 10)
-                logic_type = geneNodes.node_data.get('logic_type', 'and')
-                my_grn.add_gene(alpha, regulators, products, logic_type)
+        for item in outputs:
+            my_grn.add_species(item._label, item.node_data.get('deg_rate'))
+
+        for geneNodes in genes:
+            # Map incomming edges to regulators
+            regulators = [{'name': edge.source_node._label,
+                           'type': edge.edge_data.get("type", 1),
+                           'Kd': edge.edge_data.get("Kd", 1.0),
+                           'n': edge.edge_data.get("n", 1.0)}
+                          for edge in incoming[geneNodes]]
+            # Map outgoing edges to products
+            products = [{'name': edge.target_node._label} for edge in outgoing[geneNodes]]
+
+            alpha = geneNodes.node_data.get('alpha', 10)
+            logic_type = geneNodes.node_data.get('logic_type', 'and')
+            my_grn.add_gene(alpha, regulators, products, logic_type)
         
+        self._grn_cache = (self.scene.revision, my_grn)
         return my_grn
 
     def plot_simulation(self):
+        _use_qt_backend()
         import simulator
 
         my_grn = self.build_grn()
 
-        # Prepare simulation data
-        simulation_data = []
-        for col in range(1, self.node_table.columnCount()):
-            state = []
-            for row in range(self.node_table.rowCount()):
-                value = self.node_table.item(row, col).text() if self.node_table.item(row, col) else "0"
-                state.append(int(value))
-            simulation_data.append(tuple(state))
+        # Prepare simulation data: one input state per interval
+        simulation_data = self.sim_model.states.T
 
         t_single = int(self.duration_input.text())
         simulator.simulate_sequence(my_grn, simulation_data, t_single=t_single)
 
     # --- Build a MyGRN and plot ---
     def plot_grn(self):
-        my_grn = self.build_grn()
-        my_grn.plot_network()
+        # One MyGRN is reused so its layout cache carries over between plots,
+        # and its graph is only rebuilt when the scene has changed
+        if self._network is None:
+            self._network = MyGRN()
+        network = self._network
+        if self._network_revision == self.scene.revision:
+            network.plot_network(parent=self)
+            return
+
+        network.G.clear()
+        for item in self.scene.nodes:
+            node_type = item._node_type
+            if node_type == 'input':
+                network.add_input_species(item._label)
+            elif node_type == 'output':
+                network.add_species(item._label, item.node_data.get('deg_rate'))
+            else:
+                network.add_gene(item._label)
+        for item in self.scene.edges:
+            if item.target_node is not None:
+                network.add_edge(item.source_node._label, item.target_node._label,
+                                 reg_type=item.edge_data.get("type", 1),
+                                 kd=item.edge_data.get("Kd", 1.0),
+                                 n=item.edge_data.get("n", 1.0))
+        self._network_revision = self.scene.revision
+        network.plot_network(parent=self)
 
 def main():
     app = QApplication(sys.argv)
@@ -0,0 +1,137 @@
+"""
+Checks for the MyGRN layout routines behind "Plot GRN".
+Run with `python -m unittest test_layout` (or pytest).
+"""
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from gui import MyGRN
+
+
+def _graph(n, seed=1):
+    return nx.gnm_random_graph(n, 2 * n, seed=seed, directed=True)
+
+
+class LbfgsSpringLayoutTest(unittest.TestCase):
+    def test_energy_gradient_matches_finite_differences(self):
+        G = _graph(8)
+        A = nx.to_numpy_array(G, weight=None)
+        A = np.maximum(A, A.T)
+        np.fill_diagonal(A, 0)
+        k = 1 / np.sqrt(len(A))
+        x = np.random.default_rng(0).random(2 * len(A))
+
+        _, grad = MyGRN._fr_energy(x, A, k)
+        eps = 1e-6
+        numeric = np.empty_like(x)
+        for i in range(len(x)):
+            step = np.zeros_like(x)
+            step[i] = eps
+            numeric[i] = (MyGRN._fr_energy(x + step, A, k)[0] - MyGRN._fr_energy(x - step, A, k)[0]) / (2 * eps)
+        np.testing.assert_allclose(grad, numeric, rtol=1e-5, atol=1e-7)
+
+    def test_layout_is_centered_and_scaled(self):
+        G = _graph(12)
+        pos = np.array(list(MyGRN._lbfgs_spring_layout(G).values()))
+        self.assertEqual(pos.shape, (12, 2))
+        np.testing.assert_allclose(pos.mean(0), 0, atol=1e-12)
+        self.assertAlmostEqual(np.abs(pos).max(), 1.0)
+
+    def test_disconnected_components_keep_their_spread(self):
+        # Two I -> G -> O chains and an isolated node: the unbounded repulsion between
+        # components used to collapse each chain onto a single point after rescaling
+        G = nx.DiGraph()
+        G.add_edges_from([("I1", "G1"), ("G1", "O1"), ("I2", "G2"), ("G2", "O2")])
+        G.add_node("X")
+        pos = MyGRN._lbfgs_spring_layout(G)
+
+        for component in (["I1", "G1", "O1"], ["I2", "G2", "O2"]):
+            points = np.array([pos[v] for v in component])
+            distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1))
+            self.assertGreater(distances[np.triu_indices(len(component), 1)].min(), 0.1)
+        points = np.array(list(pos.values()))
+        np.testing.assert_allclose(points.mean(0), 0, atol=1e-12)
+        self.assertAlmostEqual(np.abs(points).max(), 1.0)
+
+
+def _exact_fr(G, iterations, seed=0):
+    """Brute-force FR iterations with the same schedule as MyGRN._barnes_hut_fr."""
+    nodes = list(G)
+    n = len(nodes)
+    index = {v: i for i, v in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges if u != v], dtype=int).reshape(-1, 2)
+    start = nx.random_layout(G, seed=seed)
+    pos = np.array([start[v] for v in nodes], dtype=float)
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+    for _ in range(iterations):
+        delta = pos[:, None] - pos[None]
+        d2 = np.maximum((delta ** 2).sum(-1), 1e-12)
+        np.fill_diagonal(d2, np.inf)
+        disp = (delta / (n * d2)[..., None]).sum(1)
+        delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+        force = delta * (np.sqrt((delta ** 2).sum(1)) * np.sqrt(n))[:, None]
+        np.add.at(disp, edges[:, 0], -force)
+        np.add.at(disp, edges[:, 1], force)
+        length = np.maximum(np.sqrt((disp ** 2).sum(1)), 0.01)
+        pos += disp * (temperature / length)[:, None]
+        temperature -= cooling
+    pos -= pos.mean(0)
+    pos /= np.abs(pos).max()
+    return dict(zip(nodes, pos))
+
+
+def _exact_repulsion(pos, k2):
+    delta = pos[:, None] - pos[None]
+    d2 = np.maximum((delta ** 2).sum(-1), 1e-12)
+    np.fill_diagonal(d2, np.inf)
+    return (delta * (k2 / d2)[..., None]).sum(1)
+
+
+class BarnesHutLayoutTest(unittest.TestCase):
+    def test_repulsion_approximates_exact_sum(self):
+        # Default theta exercises the center-of-mass approximation of far cells
+        pos = np.random.default_rng(0).random((300, 2))
+        k2 = 1 / len(pos)
+        exact = _exact_repulsion(pos, k2)
+        errors = {}
+        for theta in (0.5, 0.9):
+            approx = MyGRN._barnes_hut_repulsion(pos, k2, theta)
+            errors[theta] = np.linalg.norm(approx - exact) / np.linalg.norm(exact)
+            node_errors = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+            self.assertLess(np.median(node_errors), 0.02)
+        self.assertLess(errors[0.9], 0.03)
+        self.assertLess(errors[0.5], errors[0.9])
+
+    def test_default_theta_layout_stays_close_to_exact(self):
+        G = _graph(300)
+        approx = MyGRN._barnes_hut_fr(G, iterations=3)
+        exact = _exact_fr(G, iterations=3)
+        diff = np.array([approx[v] - exact[v] for v in G])
+        self.assertLess(np.median(np.linalg.norm(diff, axis=1)), 0.01)
+
+    def test_theta_zero_matches_exact_fr(self):
+        for n in (5, 70, 300):
+            G = _graph(n)
+            approx = MyGRN._barnes_hut_fr(G, iterations=5, theta=0.0)
+            exact = _exact_fr(G, iterations=5)
+            for v in G:
+                np.testing.assert_allclose(approx[v], exact[v], atol=1e-9)
+
+    def test_default_theta_is_centered_and_scaled(self):
+        G = _graph(MyGRN.EXACT_LAYOUT_MAX_NODES + 36)
+        pos = np.array(list(MyGRN._barnes_hut_fr(G).values()))
+        self.assertTrue(np.isfinite(pos).all())
+        np.testing.assert_allclose(pos.mean(0), 0, atol=1e-12)
+        self.assertAlmostEqual(np.abs(pos).max(), 1.0)
+
+    def test_single_node(self):
+        G = nx.DiGraph()
+        G.add_node("a")
+        np.testing.assert_array_equal(MyGRN._barnes_hut_fr(G)["a"], np.zeros(2))
+
+
+if __name__ == "__main__":
+    unittest.main()